@@ -1,5 +1,28 @@
 # entity.py
-import uuid
+import secrets
+import sys
+from itertools import count
+
+# A random per-process prefix keeps ids from colliding with those of
+# ontologies saved by other processes; the counter keeps them unique here.
+_ID_PREFIX = secrets.token_hex(4)
+_entity_ids = count(1)
+
+# Bumped whenever any entity's parents change; cached ancestor sets taken
+# under an older version are stale (descendants' caches included).
+_hierarchy_version = 0
+
+def hierarchy_version() -> int:
+    """The current hierarchy version; indexes built under an older one are stale."""
+    return _hierarchy_version
+
+# Bumped whenever any entity's name or aliases change; name indexes built
+# under an older version are stale.
+_names_version = 0
+
+def names_version() -> int:
+    """The current names version; name indexes built under an older one are stale."""
+    return _names_version
 
 class Entity:
     """
@@ -8,57 +31,136 @@ class Entity:
     Attributes:
         name (str): Lexical form of the entity, e.g., "DOG".
         word_type (str): Part of speech or type, e.g., "NOUN".
-        parents (list[Entity]): Parent types (for inheritance hierarchy).
-        aliases list[str]: Alternative names for the entity.
+        parents (tuple[Entity]): Parent types (for inheritance hierarchy); assign a new sequence to change them.
+        aliases (tuple[str]): Alternative names for the entity; assign a new tuple to change them.
         description (str | None): Optional human-readable description.
-        id (str): Unique identifier (UUID-based) for the entity.
+        id (str): Unique identifier (process prefix + counter) for the entity.
         relations (list[Relation]): Relations this entity directly participates in (propagated relations included).
     """
+    __slots__ = (
+        "id", "_name", "word_type", "_parents", "_aliases", "description", "relations",
+        "_relation_set", "_all_names", "_parent_names", "_ancestors_cache",
+    )
+
     def __init__(self, name, word_type, parents=None, aliases=None, description=None):
-        self.id = f"ENT_{uuid.uuid4().hex[:8]}" # unique entity ID
-        self.name = name.upper()
-        self.word_type = word_type.upper()
-        self.parents = parents or []
-        self.aliases = [a.upper() for a in (aliases or [])]
+        self.id = f"ENT_{_ID_PREFIX}_{next(_entity_ids):x}" # unique entity ID
+        self._name = sys.intern(name.upper())
+        self.word_type = sys.intern(word_type.upper())
+        # A new entity has no children yet, so no other cache needs invalidating
+        self._parents = tuple(parents or ())
+        self._parent_names = None  # (names version, string)
+        self._ancestors_cache = None  # (hierarchy version, frozenset[Entity])
+        self._aliases = tuple(sys.intern(a.upper()) for a in (aliases or ()))
         self.description = description
         self.relations = []  # direct and propagated relations
+        self._relation_set = set()  # mirrors self.relations for O(1) membership tests
+        self._all_names = frozenset((self._name, *self._aliases))
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = sys.intern(name.upper())
+        self._names_changed()
+
+    @property
+    def aliases(self):
+        return self._aliases
+
+    @aliases.setter
+    def aliases(self, aliases):
+        # Kept as a tuple so every change comes through here and reaches the name indexes
+        self._aliases = tuple(sys.intern(a.upper()) for a in aliases)
+        self._names_changed()
+
+    @property
+    def parents(self):
+        return self._parents
+
+    @parents.setter
+    def parents(self, parents):
+        # Kept as a tuple so every change comes through here; bumping the
+        # version marks cached ancestor sets and descendants indexes stale.
+        global _hierarchy_version
+        self._parents = tuple(parents)
+        self._parent_names = None
+        _hierarchy_version += 1
+
+    def parent_names(self) -> str:
+        """Comma-separated parent names, as shown by describe_hierarchy (cached until a name changes)."""
+        cached = self._parent_names
+        if cached is None or cached[0] != _names_version:
+            cached = self._parent_names = (_names_version, ", ".join(p.name for p in self._parents))
+        return cached[1]
+
+    def _names_changed(self):
+        """Refresh the cached name set and mark every name index stale."""
+        global _names_version
+        self._all_names = frozenset((self._name, *self._aliases))
+        _names_version += 1
 
     def matches_name(self, query_name: str) -> bool:
         """Check if the query_name matches the primary name or any alias."""
-        query_upper = query_name.upper()
-        return query_upper == self.name or query_upper in self.aliases
+        return self._matches_name_upper(query_name.upper())
+
+    def _matches_name_upper(self, query_upper: str) -> bool:
+        """matches_name for a query that is already upper-cased."""
+        return query_upper in self._all_names
     
-    def get_all_ancestors(self, seen=None):
+    def add_relation(self, relation) -> bool:
+        """
+        Attach a relation to this entity unless it is already attached.
+
+        Returns:
+            bool: True if the relation was newly attached.
         """
-        Recursively return all ancestor entities in the hierarchy.
+        if relation in self._relation_set:
+            return False
+        self._relation_set.add(relation)
+        self.relations.append(relation)
+        return True
 
-        Args:
-            seen (set[Entity], optional): Entities already visited to prevent cycles.
+    def get_all_ancestors(self):
+        """
+        Return all ancestor entities in the hierarchy.
+
+        Walks the parent graph with an explicit stack, so deep hierarchies
+        do not hit the recursion limit and cycles are visited only once.
+        The result is cached until the hierarchy changes.
 
         Returns:
-            set[Entity]: All ancestors of this entity.
+            frozenset[Entity]: All ancestors of this entity.
         """
-        if seen is None:
-            seen = set()
-        for p in self.parents:
+        cached = self._ancestors_cache
+        if cached is not None and cached[0] == _hierarchy_version:
+            return cached[1]
+
+        seen = set()
+        stack = list(self.parents)
+        while stack:
+            p = stack.pop()
             if p not in seen:
                 seen.add(p)
-                p.get_all_ancestors(seen)
-        return seen
+                stack.extend(p.parents)
+        ancestors = frozenset(seen)
+        self._ancestors_cache = (_hierarchy_version, ancestors)
+        return ancestors
 
     def all_relations(self):
         """
-        Return all active relations involving this entity, including inherited ones.
+        Return all relations involving this entity, including inherited ones.
+        Relations carry no activity state, so none are filtered out.
 
         Returns:
-            list[Relation]: Active relations without duplicates.
+            list[Relation]: Relations without duplicates, in attachment order.
         """
-        active_rels = [r for r in self.relations if r.is_active()]
-        return list(dict.fromkeys(active_rels))  # remove duplicates, preserve order
+        return list(self.relations)  # add_relation already skips duplicates
 
     def all_names(self):
         """Return the entity’s canonical name plus any aliases."""
-        return {self.name, *self.aliases}
+        return self._all_names
 
     def to_dict(self) -> dict:
         """
@@ -69,7 +171,7 @@ class Entity:
             "name": self.name,
             "word_type": self.word_type,
             "parents": [p.id for p in self.parents],  # store parent IDs
-            "aliases": self.aliases,
+            "aliases": list(self.aliases),
             "description": self.description
         }
 
@@ -1,25 +1,44 @@
 from .truth import TruthState, TruthValue
-from .relation import Relation
+from .relation import Predicate, Relation
+
+# (antecedent state, implication state) -> inferred consequent truth.
+# Every combination not listed here leaves the consequent UNKNOWN.
+_CONSEQUENT_TRUTH = {
+    (TruthState.TRUE, TruthState.TRUE): TruthValue.TRUE,
+}
+
+# Shared by every implication; not registered with any ontology
+_IMPLIES = Predicate("IMPLIES", roles=["antecedent", "consequent"])
 
 class ImpliesRelation(Relation):
-    def __init__(self, antecedent, consequent):
+    """
+    antecedent → consequent between two relations.
+    The implication carries its own truth value like any other relation.
+    """
+    __slots__ = ("antecedent", "consequent")
+
+    def __init__(self, antecedent, consequent, truth_value: TruthValue | None = None):
+        super().__init__(
+            _IMPLIES,
+            {"antecedent": antecedent, "consequent": consequent},
+            truth_value=truth_value,
+        )
         self.antecedent = antecedent
         self.consequent = consequent
 
     def infer_consequent_truth(self):
-        if self.consequent.truth is not None:
-            return self.consequent.truth_value
-
-        if self.truth == TruthValue.FALSE:
-            return TruthValue(TruthState.UNKNOWN)
-
-        if self.antecedent.truth == TruthValue.TRUE and self.truth == TruthValue.TRUE:
-            return TruthValue(TruthState.TRUE)
-
-        if self.antecedent.truth == TruthValue.FALSE:
-            return TruthValue(TruthState.UNKNOWN)
+        """The consequent's own truth if known, otherwise inferred from the antecedent and this implication."""
+        consequent_truth = self.consequent.truth_value
+        if consequent_truth is not None and consequent_truth.value is not TruthState.UNKNOWN:
+            return consequent_truth
 
-        return TruthValue(TruthState.UNKNOWN)
+        antecedent_truth = self.antecedent.truth_value
+        truth = self.truth_value
+        key = (
+            antecedent_truth.value if antecedent_truth is not None else None,
+            truth.value if truth is not None else None,
+        )
+        return _CONSEQUENT_TRUTH.get(key, TruthValue.UNKNOWN)
 
     def __repr__(self):
-        return f"IMPLIES({self.antecedent} → {self.consequent}): {self.truth_value}"
\ No newline at end of file
+        return f"IMPLIES({self.antecedent} → {self.consequent}): {self.truth_value}"
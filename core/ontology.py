@@ -1,5 +1,7 @@
 # ontology.py
+import sys
 from .entity import *
+from .entity import hierarchy_version, names_version
 from .relation import *
 from .temporal import *
 from .quantifier import *
@@ -15,6 +17,28 @@ class Ontology:
         self.predicates = {}  # dict[str, Predicate]
         self.relations = []   # list[Relation]
         self.quantified_relations = []   # list[QuantifiedRelation]
+        self._descendants = {}  # dict[Entity, dict[Entity, None]]: ancestor -> descendants, in registration order
+        self._descendants_version = hierarchy_version()  # hierarchy version _descendants was built under
+        self._descendants_size = 0  # entities covered by _descendants
+        self._unregistered_ancestors = False  # some entity has an ancestor missing from self.entities
+        self._name_index = {}   # dict[str, list[Entity]]: upper-cased name or alias -> entities
+        self._name_index_version = names_version()  # names version _name_index was built under
+        self._name_index_size = 0  # entities covered by _name_index
+
+        # Duplicate-detection indexes: relation key -> first registered relation
+        self._relation_index = {}   # any Relation (including temporal)
+        self._temporal_index = {}   # TemporalRelations only
+        self._rel_by_pred = {}      # dict[str, list[Relation]]: predicate name -> relations
+        self._rel_by_pred_entity = {}   # dict[(str, Entity), list[Relation]]: predicate name x participant -> relations
+        self._indexed_relations = 0  # length of the self.relations prefix covered by the indexes above
+        # Entity buckets can miss relations: a participant missing from
+        # self.entities, or relations appended to self.relations directly
+        self._partial_entity_buckets = False
+
+    @staticmethod
+    def _norm(name: str) -> str:
+        """Normalize a name at the public API boundary: upper-cased and interned."""
+        return sys.intern(name.upper())
 
     def add_entity(self, name, word_type, parents=None, description=None):
         """
@@ -23,15 +47,71 @@ class Ontology:
         Returns:
             Entity: The newly created entity.
         """
-        e = Entity(name, word_type, parents, description)
+        e = Entity(name, word_type, parents, description=description)
         if e.id in self.entities:
             raise ValueError(f"Entity '{e.id}' already exists.")
-        self.entities[e.id] = e
+        self._register_entity(e)
         return e
 
+    def add_entities(self, rows) -> list[Entity]:
+        """
+        Create and register several entities in one call.
+
+        Args:
+            rows: iterable of dicts with add_entity's keyword arguments.
+                Parents may be given as Entity objects or by name; a name
+                refers to an entity earlier in the same batch, or else to
+                the ontology's only entity with that name or alias.
+                Names must be unique within the batch; nothing is
+                registered if the batch fails.
+
+        Returns:
+            list[Entity]: The new entities, in row order.
+        """
+        batch = {}  # upper-cased name -> entity created by this call
+        created = []
+        for row in rows:
+            parents = [
+                p if isinstance(p, Entity) else self._resolve_parent(p, batch)
+                for p in row.get("parents") or ()
+            ]
+            e = Entity(row["name"], row["word_type"], parents, description=row.get("description"))
+            if e.name in batch:
+                # Parent names would be ambiguous, as for homonyms already in the ontology
+                raise ValueError(f"Entity '{e.name}' appears more than once in the batch.")
+            batch[e.name] = e
+            created.append(e)
+
+        for e in created:
+            self._register_entity(e)
+        return created
+
+    def _resolve_parent(self, name: str, batch: dict) -> Entity:
+        name = self._norm(name)
+        if name in batch:
+            return batch[name]
+        named = self._named(name)
+        if len(named) != 1:
+            raise ValueError(f"Parent '{name}' is {'ambiguous' if named else 'unknown'}.")
+        return named[0]
+
+    def _register_entity(self, e: Entity):
+        """Store an entity and index it by name, alias and ancestry."""
+        # A stale index is rebuilt as a whole on next use, this entity included
+        names_current = self._name_index_is_current()
+        descendants_current = self._descendants_is_current()
+        self.entities[e.id] = e
+        if names_current:
+            for n in e.all_names():
+                self._name_index.setdefault(n, []).append(e)
+            self._name_index_size += 1
+        if descendants_current:
+            self._index_ancestry(e, self._descendants)
+            self._descendants_size += 1
+
     def add_alias(self, alias_name: str, target_entity: Entity):
         """Register an alias purely for query purposes, supporting homonyms."""
-        alias_name = alias_name.upper()
+        alias_name = self._norm(alias_name)
         if alias_name not in self.alias_map:
             self.alias_map[alias_name] = []
 
@@ -39,23 +119,47 @@ class Ontology:
         if target_entity not in self.alias_map[alias_name]:
             self.alias_map[alias_name].append(target_entity)
 
-        # Ensure the target entity also stores the alias
+        # Ensure the target entity also stores the alias. That marks the name
+        # index stale; the rebuild keeps each name's entities in registration order.
         if alias_name not in target_entity.aliases:
-            target_entity.aliases.append(alias_name)
+            target_entity.aliases = (*target_entity.aliases, alias_name)
+
+    def _named(self, name: str):
+        """Registered entities with this normalized name or alias, in registration order."""
+        if not self._name_index_is_current():
+            index = {}
+            for e in self.entities.values():
+                for n in e.all_names():
+                    index.setdefault(n, []).append(e)
+            self._name_index = index
+            self._name_index_version = names_version()
+            self._name_index_size = len(self.entities)
+        return self._name_index.get(name, ())
+
+    def _name_index_is_current(self) -> bool:
+        # The size check catches entities stored into self.entities directly
+        return self._name_index_version == names_version() and self._name_index_size == len(self.entities)
 
     def describe_hierarchy(self, entity, level=0, seen=None, show_description=False):
         """
-        Print entity hierarchy recursively with optional descriptions.
+        Print entity hierarchy depth-first with optional descriptions.
+        Each entity is printed once; parents already shown are skipped.
         """
         if seen is None:
             seen = set()
-        indent = "    " * level + "└─" if level > 0 else ""
-        desc_str = f" — {entity.description}" if show_description and entity.description else ""
-        print(f"{indent}{entity.name} ({', '.join([p.name for p in entity.parents])}){desc_str}")
-        seen.add(entity.id)
-        for p in entity.parents:
-            if p.id not in seen:
-                self.describe_hierarchy(p, level=level+1, seen=seen, show_description=show_description)
+        lines = []
+        stack = [(entity, level)]
+        while stack:
+            e, depth = stack.pop()
+            if e.id in seen:
+                continue
+            seen.add(e.id)
+            indent = "    " * depth + "└─" if depth > 0 else ""
+            desc_str = f" — {e.description}" if show_description and e.description else ""
+            lines.append(f"{indent}{e.name} ({e.parent_names()}){desc_str}")
+            # Push in reverse so parents are visited in declaration order
+            stack.extend((p, depth + 1) for p in reversed(e.parents))
+        print("\n".join(lines))
 
     def query_entities(
         self,
@@ -76,12 +180,45 @@ class Ontology:
         """
         matches = []
 
-        for e in self.entities.values():
-            if name and not e.matches_name(name):
-                continue
-            if parent and not any(p.matches_name(parent) for p in e.parents):
+        # Normalize each filter once instead of once per entity tested
+        name = self._norm(name) if name else None
+        parent = self._norm(parent) if parent else None
+        ancestor = self._norm(ancestor) if ancestor else None
+
+        # Each indexed filter gives a posting list of possible matches; the
+        # smallest ordered one is scanned and the rest are probed by membership.
+        postings = []
+        if name:
+            postings.append(self._named(name))
+        # The name index only knows registered entities, so if any ancestor is
+        # unregistered, the parent/ancestor filters are tested per entity instead.
+        live_hierarchy = False
+        if parent or ancestor:
+            self._descendants_index()  # brings _unregistered_ancestors up to date
+            live_hierarchy = self._unregistered_ancestors
+        if parent and not live_hierarchy:
+            # Entities named like the parent filter; a direct parent must be one of them
+            parent_matches = set(self._named(parent))
+            postings.append(self._descendants_of(parent_matches))
+        if ancestor and not live_hierarchy:
+            # Resolve the ancestor filter once through the descendants index
+            # instead of walking every entity's ancestor chain.
+            postings.append(self._descendants_of(self._named(ancestor)))
+
+        # Sets (merged homonym postings) have no registration order, so never drive the scan
+        ordered = [p for p in postings if not isinstance(p, set)]
+        candidates = min(ordered, key=len) if ordered else self.entities.values()
+        probes = [p for p in postings if p is not candidates]
+
+        for e in candidates:
+            if any(e not in p for p in probes):
                 continue
-            if ancestor and not any(a.matches_name(ancestor) for a in e.get_all_ancestors()):
+            if live_hierarchy:
+                if parent and not any(p._matches_name_upper(parent) for p in e.parents):
+                    continue
+                if ancestor and not any(a._matches_name_upper(ancestor) for a in e.get_all_ancestors()):
+                    continue
+            elif parent and parent_matches.isdisjoint(e.parents):
                 continue
             if involved_in_relation and not any(
                 involved_in_relation in [rel_entity.name for rel_entity in e.relations] or
@@ -97,9 +234,49 @@ class Ontology:
         else:
             return matches
 
+    def _descendants_of(self, ancestors):
+        """
+        Descendants of any of the given entities, from the descendants index.
+        A single ancestor's posting is returned as-is (registration order);
+        several are merged into an unordered set.
+        """
+        if not ancestors:
+            return ()
+        descendants = self._descendants_index()
+        if len(ancestors) == 1:
+            return descendants.get(next(iter(ancestors)), {})
+        merged = set()
+        for a in ancestors:
+            merged.update(descendants.get(a, ()))
+        return merged
+
+    def _descendants_index(self):
+        """The descendants index, rebuilt first if any entity's parents changed since it was built."""
+        if not self._descendants_is_current():
+            descendants = {}
+            self._unregistered_ancestors = False
+            for e in self.entities.values():
+                self._index_ancestry(e, descendants)
+            self._descendants = descendants
+            self._descendants_version = hierarchy_version()
+            self._descendants_size = len(self.entities)
+        return self._descendants
+
+    def _descendants_is_current(self) -> bool:
+        # The size check catches entities stored into self.entities directly
+        return self._descendants_version == hierarchy_version() and self._descendants_size == len(self.entities)
+
+    def _index_ancestry(self, e: Entity, descendants: dict):
+        """Add e under each of its ancestors, noting any ancestor this ontology does not hold."""
+        entities = self.entities
+        for anc in e.get_all_ancestors():
+            descendants.setdefault(anc, {})[e] = None
+            if entities.get(anc.id) is not anc:
+                self._unregistered_ancestors = True
+
     def add_predicate(self, name: str):
         """Create and register a new predicate."""
-        name = name.upper()  # standardize
+        name = self._norm(name)  # standardize
 
         if name in self.predicates:
             raise ValueError(f"Predicate '{name}' already exists.")
@@ -123,20 +300,33 @@ class Ontology:
             role_mapping: Dict mapping original roles -> inverse roles.
         """
         # Create the inverse Predicate
-        inverse_pred = Predicate(inverse_name, roles=list(role_mapping.values()))
-        inverse_pred.inverse_of = original_predicate
-        inverse_pred.role_mapping = role_mapping
+        inverse_pred = PredicateInverse(
+            inverse_name,
+            roles=list(role_mapping.values()),
+            inverse_of=original_predicate,
+            role_mapping=role_mapping
+        )
 
         # Register the inverse
         original_predicate.inverses.append(inverse_pred)
         self.predicates[inverse_pred.name] = inverse_pred
 
         # Optionally: generate inverse Relations for existing Relations
-        for rel in self.relations:
+        self._sync_relations()
+        for rel in list(self._rel_by_pred.get(original_predicate.name, ())):
             if rel.predicate == original_predicate:
                 self._create_inverse_relation(rel, inverse_pred)
 
         return inverse_pred
+
+    def _create_inverse_relation(self, rel, inverse_pred: PredicateInverse):
+        """Register the inverse of rel under inverse_pred, carrying over its truth value."""
+        tv = rel.truth_value
+        return self.add_relation(
+            inverse_pred,
+            inverse_pred.invert_roles(rel.roles),
+            truth_value=TruthValue(tv.value, tv.certainty) if tv else None,
+        )
     
     def query_predicates(
         self,
@@ -184,12 +374,10 @@ class Ontology:
             Relation: The newly created or existing relation.
         """
         # Prevent duplicates
-        for existing in self.relations:
-            if (
-                existing.predicate == predicate
-                and existing.roles == roles
-            ):
-                return existing
+        self._sync_relations()
+        existing = self._relation_index.get(self._relation_key(predicate, roles))
+        if existing is not None:
+            return existing
 
         # Create relation with truth_value if provided
         r = Relation(
@@ -197,12 +385,7 @@ class Ontology:
             roles,
             truth_value=truth_value,
         )
-        self.relations.append(r)
-
-        # Attach to entities
-        for e in roles.values():
-            e.relations.append(r)
-
+        self._register_relation(r)
         return r
 
     def add_temporal_relation(
@@ -223,13 +406,10 @@ class Ontology:
             truth_value (TruthValue | None): optional explicit truth value.
             active (bool): whether the relation starts active
         """
-        for existing in self.relations:
-            if (
-                isinstance(existing, TemporalRelation)
-                and existing.predicate == predicate
-                and existing.roles == roles
-            ):
-                return existing
+        self._sync_relations()
+        existing = self._temporal_index.get(self._relation_key(predicate, roles))
+        if existing is not None:
+            return existing
 
         # Create TemporalRelation with optional truth_value
         r = TemporalRelation(
@@ -237,13 +417,89 @@ class Ontology:
             roles=roles,
             default_truth=default_truth
         )
+        self._register_relation(r)
+        return r
 
-        self.relations.append(r)
-
-        for e in roles.values():
-            e.relations.append(r)
+    @staticmethod
+    def _relation_key(predicate, roles: dict):
+        """Hashable duplicate-detection key: same predicate object and role mapping (see Relation._roles_key)."""
+        return (predicate, frozenset(roles.items()))
 
-        return r
+    def _register_relation(self, r):
+        """
+        Store a relation, index it for duplicate checks and attach it to its entities.
+        Relations appended to self.relations directly are indexed lazily by
+        _sync_relations, but are not attached to their entities.
+        """
+        self._sync_relations()
+        self.relations.append(r)
+        self._index_relation(r)
+        self._indexed_relations += 1
+
+        entities = self.entities
+        for e in r.roles.values():
+            if e.add_relation(r):
+                self._rel_by_pred_entity.setdefault((r.predicate.name, e), []).append(r)
+            if entities.get(e.id) is not e:
+                self._partial_entity_buckets = True
+
+    def _index_relation(self, r):
+        """Add r to the duplicate-detection and predicate indexes."""
+        key = (r.predicate, r._roles_key)
+        self._relation_index.setdefault(key, r)
+        if isinstance(r, TemporalRelation):
+            self._temporal_index.setdefault(key, r)
+        self._rel_by_pred.setdefault(r.predicate.name, []).append(r)
+
+    def _sync_relations(self):
+        """
+        Bring the relation indexes in line with self.relations after it was
+        changed directly: appended relations are indexed, and if the list got
+        shorter every index is rebuilt from it. Either way entity buckets stop
+        being used to narrow queries, since they were not updated.
+        """
+        relations = self.relations
+        start = self._indexed_relations
+        if len(relations) == start:
+            return
+        if len(relations) < start:
+            self._relation_index = {}
+            self._temporal_index = {}
+            self._rel_by_pred = {}
+            self._rel_by_pred_entity = {}
+            start = 0
+        for r in relations[start:]:
+            self._index_relation(r)
+        self._indexed_relations = len(relations)
+        self._partial_entity_buckets = True
+
+    def _relation_candidates(self, predicate, entities):
+        """
+        Pick the smallest indexed bucket of relations that can satisfy the
+        predicate/entity filters, falling back to every relation.
+        Buckets keep registration order, so results come back in the same order.
+        Entity buckets are only used when the name resolves to exactly one
+        registered entity and every relation sits in its participants'
+        buckets, since the name could otherwise also belong to an entity
+        outside the name index.
+        """
+        self._sync_relations()
+        candidates = self.relations
+        if predicate:
+            candidates = self._rel_by_pred.get(predicate, ())
+        if self._partial_entity_buckets:
+            return candidates
+        for ent in entities or ():
+            named = self._named(ent)
+            if len(named) != 1:
+                continue  # unknown or homonym: leave it to the entity filter
+            if predicate:
+                bucket = self._rel_by_pred_entity.get((predicate, named[0]), ())
+            else:
+                bucket = named[0].relations
+            if len(bucket) < len(candidates):
+                candidates = bucket
+        return candidates
 
     def add_quantified_relation(self, quantifier, variables, relation_template, truth_value=None):
         """
@@ -262,6 +518,8 @@ class Ontology:
             relation_template=relation_template,
             truth_value=truth_value
         )
+        if relation_template.get("predicate") in self.predicates:
+            qr._build_plan(self.predicates)  # bind instances to the registered Predicate
         self.quantified_relations.append(qr)
         return qr
 
@@ -288,32 +546,34 @@ class Ontology:
         """
         results = []
 
+        # Cheapest filters run first; the entity name set is only built when needed
+        entity_set = frozenset(entities) if entities else None
+
         # --- Relations ---
-        for r in self.relations:
+        for r in self._relation_candidates(predicate, entities):
+            # Predicate filter
+            if predicate and r.predicate.name != predicate:
+                continue
+
             # Role filter
             if roles and not all(role in r.roles for role in roles):
                 continue
             
-            # Entity filter
-            if entities:
-                relation_entities = [
-                    e.name for e in r.roles.values()
-                ] + sum([e.aliases for e in r.roles.values()], [])
-                # Must contain *all* entities in the query
-                if not all(ent in relation_entities for ent in entities):
+            # Entity filter: must contain *all* entities in the query
+            if entity_set:
+                relation_entities = set()
+                for e in r.roles.values():
+                    relation_entities.update(e.all_names())
+                if not entity_set.issubset(relation_entities):
                     continue
 
-            # Predicate filter
-            if predicate and r.predicate.name != predicate:
-                continue
-
             # Truth filter
             if truth_value:
                 tv = r.truth_value
                 if isinstance(r, TemporalRelation) and moment:
-                    interval = next((i for i in r.interval_truths if i.contains(moment)), None)
+                    interval = r._interval_at(moment)
                     if interval:
-                        tv = r.interval_truths[interval]
+                        tv = r._interval_truths[interval]
                     else:
                         tv = r.default_truth
                 if tv != truth_value:
@@ -323,26 +583,26 @@ class Ontology:
 
         # --- QuantifiedRelations ---
         for qr in getattr(self, "quantified_relations", []):
+            # Predicate filter
+            if predicate and qr.relation_template["predicate"] != predicate:
+                continue
+
             # Role filter
             if roles:
                 if not all(role in qr.relation_template["roles"] for role in roles):
                     continue
                 
             # Entity filter
-            if entities:
+            if entity_set:
                 involved = set()
                 for role_entity in qr.relation_template["roles"].values():
                     if isinstance(role_entity, str):
                         involved.add(role_entity)
                     else:
                         involved.add(role_entity.name)
-                if not all(ent in involved for ent in entities):
+                if not entity_set.issubset(involved):
                     continue
 
-            # Predicate filter
-            if predicate and qr.relation_template["predicate"] != predicate:
-                continue
-
             # Truth filter
             if truth_value and qr.truth_value != truth_value:
                 continue
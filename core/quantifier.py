@@ -1,8 +1,7 @@
 # quantifier.py
-import uuid
 from enum import Enum
 from .truth import TruthValue, TruthState
-from .relation import Relation
+from .relation import Predicate, Relation
 
 class Quantifier(Enum):
     FORALL = "FORALL"
@@ -14,6 +13,8 @@ class QuantifiedRelation:
     FORALL X: LOVES(X, TONYA)
     EXISTS Y: OWNS(DEX, Y)
     """
+    __slots__ = ("quantifier", "variables", "relation_template", "truth_value", "_hash", "_plan")
+
     def __init__(self, quantifier: Quantifier, variables: list[str], relation_template, truth_value: TruthValue | None):
         """
         Args:
@@ -26,31 +27,48 @@ class QuantifiedRelation:
             truth_value (TruthValue | None): Optional initial truth value (defaults to UNKNOWN)
         """
         self.quantifier = quantifier
-        self.variables = [v.upper() for v in variables]
+        self.variables = tuple(v.upper() for v in variables)
         self.relation_template = relation_template
         self.truth_value = truth_value or TruthValue(value=TruthState.UNKNOWN)
+        self._hash = None  # computed lazily; template is treated as immutable
+        self._plan = None  # (predicate, role plan) for instantiate, built on first use
 
     def instantiate(self, **kwargs):
         """Generate a Relation from the template with variables substituted"""
-        predicate_name = self.relation_template.predicate
-        roles_template = self.relation_template.roles
+        predicate, role_plan = self._plan or self._build_plan()
 
         roles_instantiated = {}
-        for role, val in roles_template.items():
-            if isinstance(val, str) and val.startswith("$"):
-                var_name = val[1:]
-                if var_name not in kwargs:
-                    raise ValueError(f"Missing variable {var_name}")
+        for role, var_name, literal in role_plan:
+            if var_name is None:
+                roles_instantiated[role] = literal
+            elif var_name in kwargs:
                 roles_instantiated[role] = kwargs[var_name]
             else:
-                roles_instantiated[role] = val
+                raise ValueError(f"Missing variable {var_name}")
+
+        return Relation(predicate, roles=roles_instantiated)
 
-        return Relation(predicate_name, roles=roles_instantiated)
+    def _build_plan(self, predicates: dict | None = None):
+        """
+        Resolve the template once: the predicate, and per role either the
+        variable to bind or the literal value to copy.
+        A predicate name is looked up in predicates (an ontology's registry)
+        when given, so instances share the registered Predicate.
+        """
+        predicate = self.relation_template["predicate"]
+        if not isinstance(predicate, Predicate):
+            predicate = (predicates or {}).get(predicate) or Predicate(predicate)
+        role_plan = tuple(
+            (role, val[1:], None) if isinstance(val, str) and val.startswith("$") else (role, None, val)
+            for role, val in self.relation_template["roles"].items()
+        )
+        self._plan = (predicate, role_plan)
+        return self._plan
 
     def to_dict(self):
         return {
             "quantifier": self.quantifier.name,
-            "variables": self.variables,
+            "variables": list(self.variables),
             "relation_template": self.relation_template,
             "truth_value": self.truth_value.to_dict(),
         }
@@ -58,16 +76,24 @@ class QuantifiedRelation:
     @classmethod
     def from_dict(cls, data, ontology):
         from .truth import TruthValue
-        return cls(
+        qr = cls(
             quantifier=Quantifier[data["quantifier"]],
             variables=data["variables"],
             relation_template=data["relation_template"],
             truth_value=TruthValue.from_dict(data["truth_value"])
         )
+        if data["relation_template"].get("predicate") in ontology.predicates:
+            qr._build_plan(ontology.predicates)
+        return qr
     
     def __eq__(self, other):
         if not isinstance(other, QuantifiedRelation):
             return False
+        if self is other:
+            return True
+        # Cached hashes that differ settle it without comparing templates
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
         return (
             self.quantifier == other.quantifier and
             self.variables == other.variables and
@@ -75,11 +101,14 @@ class QuantifiedRelation:
         )
 
     def __hash__(self):
-        return hash((
-            self.quantifier,
-            tuple(self.variables),
-            frozenset(self._flatten_template(self.relation_template))
-        ))
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((
+                self.quantifier,
+                self.variables,
+                frozenset(self._flatten_template(self.relation_template))
+            ))
+        return h
 
     @staticmethod
     def _flatten_template(template):
@@ -95,6 +124,8 @@ class QuantifiedRelation:
             return template
         
     def __repr__(self):
-        vars_str = ", ".join(var for var in self.variables)
-        role_values_str = ", ".join(f"{rv}" for rv in self.relation_template.roles.values())
-        return f"{self.quantifier.name}({vars_str}): {self.relation_template.predicate.name}({role_values_str}): {self.truth_value}"
\ No newline at end of file
+        vars_str = ", ".join(self.variables)
+        predicate = self.relation_template["predicate"]
+        predicate_name = predicate.name if isinstance(predicate, Predicate) else predicate
+        role_values_str = ", ".join(f"{rv}" for rv in self.relation_template["roles"].values())
+        return f"{self.quantifier.name}({vars_str}): {predicate_name}({role_values_str}): {self.truth_value}"
\ No newline at end of file
@@ -1,20 +1,28 @@
 # relation.py
-import uuid
+import secrets
+import sys
+from itertools import count
 from typing import Dict, List
 from .truth import TruthState, TruthValue
 
+# See entity.py: process prefix + counter instead of random bytes per relation.
+_ID_PREFIX = secrets.token_hex(4)
+_relation_ids = count(1)
+
 class Predicate:
     """Represents a type of relation (like IS, HAS, TAKES_TO)."""
+    __slots__ = ("name", "roles", "inverses")
+
     def __init__(self, name: str, roles: list[str] | None = None):
-        self.name = name.upper()
-        self.roles = roles or []
+        self.name = sys.intern(name.upper())
+        self.roles = tuple(roles) if roles else ()
         self.inverses = []
 
     def to_dict(self) -> dict:
         """Serialize the Predicate for saving."""
         return {
             "name": self.name,
-            "roles": self.roles,
+            "roles": list(self.roles),
             "inverses": [inv.name for inv in self.inverses],  # just store names
         }
 
@@ -30,15 +38,22 @@ class Predicate:
         return p
 
 class PredicateInverse(Predicate):
+    __slots__ = ("inverse_of", "role_mapping", "_role_pairs")
+
     def __init__(self, name, roles, inverse_of, role_mapping):
         super().__init__(name, roles)
         self.inverse_of = inverse_of       # original Predicate
         self.role_mapping = role_mapping   # dict: original_role -> inverse_role
+        self._role_pairs = tuple(role_mapping.items())  # same mapping, iterated when inverting
+
+    def invert_roles(self, roles: dict) -> dict:
+        """Map an original relation's role->entity dict onto this predicate's roles."""
+        return {inv: roles[orig] for orig, inv in self._role_pairs if orig in roles}
 
     def to_dict(self):
         return {
             "name": self.name,
-            "roles": self.roles,
+            "roles": list(self.roles),
             "inverse_of": self.inverse_of.name if self.inverse_of else None,
             "role_mapping": self.role_mapping,
             "inverses": [inv.name for inv in self.inverses],
@@ -66,6 +81,7 @@ class Relation:
 
     Supports n-ary roles and truth evaluation via TruthValue.
     """
+    __slots__ = ("id", "predicate", "predicate_name", "roles", "_roles_key", "truth_value", "dependents", "_roles_str")
 
     def __init__(
         self,
@@ -81,12 +97,14 @@ class Relation:
             relation_type (str): Logical type: GENERAL, PERMANENT, etc.
             truth_value (TruthValue | None): initial truth state (defaults to UNKNOWN)
         """
-        self.id = f"REL_{uuid.uuid4().hex[:8]}"
+        self.id = f"REL_{_ID_PREFIX}_{next(_relation_ids):x}"
         self.predicate = predicate
-        self.predicate_name = predicate.name.upper()
+        self.predicate_name = predicate.name  # already upper-cased and interned by Predicate
         self.roles = roles
+        self._roles_key = frozenset(roles.items())  # hashable form of roles; roles must not change after this
         self.truth_value = truth_value or TruthValue(value=TruthState.UNKNOWN)
         self.dependents = set()
+        self._roles_str = None  # cached role list for __repr__, built on first use
 
     def to_dict(self):
         return {
@@ -101,12 +119,18 @@ class Relation:
         predicate = ontology.predicates.get(data["predicate"])
         if not predicate:
             raise ValueError(f"Predicate {data['predicate']} not found in ontology.")
-        roles = {role: ontology.entities[entity_id] for role, entity_id in data["roles"].items()}
+        entities = ontology.entities
+        roles = {role: entities[entity_id] for role, entity_id in data["roles"].items()}
         truth_value = TruthValue.from_dict(data["truth_value"]) if data.get("truth_value") else None
         r = cls(predicate, roles, truth_value=truth_value)
         r.id = data.get("id")
         return r
     
+    def _role_values_str(self) -> str:
+        """Comma-separated role fillers for __repr__; roles are fixed, so this is computed once."""
+        if self._roles_str is None:
+            self._roles_str = ", ".join([f"{rv}" for rv in self.roles.values()])
+        return self._roles_str
+
     def __repr__(self):
-        role_values_str = ", ".join([f"{rv}" for rv in self.roles.values()])
-        return f"Relation({self.predicate_name}({role_values_str})): {self.truth_value}"
+        return f"Relation({self.predicate_name}({self._role_values_str()})): {self.truth_value}"
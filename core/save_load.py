@@ -30,25 +30,29 @@ def load_ontology(filepath: str) -> Ontology:
 
     ontology = Ontology()
 
+    # Bound methods are looked up once rather than per record
+    entity_from_dict = Entity.from_dict
+    register_entity = ontology._register_entity
+    relation_from_dict = Relation.from_dict
+    register_relation = ontology._register_relation
+
     # Reconstruct entities
     for e_dict in data.get("entities", []):
-        e = Entity.from_dict(e_dict)
-        ontology.entities[e.id] = e
+        register_entity(entity_from_dict(e_dict))
 
     # Reconstruct predicates
+    predicates = ontology.predicates
     for p_dict in data.get("predicates", []):
         p = Predicate.from_dict(p_dict)
-        ontology.predicates[p.name] = p
+        predicates[p.name] = p
 
     # Reconstruct relations
     for r_dict in data.get("relations", []):
         if r_dict.get("relation_type") == "TEMPORAL":
             r = TemporalRelation.from_dict(r_dict, ontology)
         else:
-            r = Relation.from_dict(r_dict, ontology)
-        ontology.relations.append(r)
-        for e in r.roles.values():
-            e.relations.append(r)
+            r = relation_from_dict(r_dict, ontology)
+        register_relation(r)
 
     # Reconstruct quantified relations
     ontology.quantified_relations = []
@@ -1,16 +1,45 @@
 # temporal.py
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Optional, List
 from .relation import Relation
 from .truth import TruthState, TruthValue
 
+# Bumped whenever any interval's bounds change; sorted interval views built
+# under an older version are stale.
+_bounds_version = 0
+
+@lru_cache(maxsize=4096)
+def _parse_iso(s: str | None) -> datetime | None:
+    """Parse an ISO timestamp; saved ontologies tend to repeat the same boundaries."""
+    return datetime.fromisoformat(s) if s else None
+
 class TimeInterval:
     """
     Represents a period of time with an optional start and end.
+    Change bounds through modify() so cached bounds and sorted views stay in step.
     """
+    __slots__ = ("start_time", "end_time", "_sort_key")
+
     def __init__(self, start_time: Optional[datetime], end_time: Optional[datetime] = None):
         self.start_time = start_time
         self.end_time = end_time
+        self._update_bounds()
+
+    def _update_bounds(self):
+        """
+        Cache the ordering key: start, then end with an open end last.
+        Open bounds are flagged rather than replaced by datetime.min/max,
+        which could not be compared with timezone-aware bounds.
+        """
+        start, end = self.start_time, self.end_time
+        if start is None:
+            self._sort_key = None  # open start: sorts before everything
+        else:
+            self._sort_key = (start, end is None, start if end is None else end)
 
     def contains(self, moment: datetime) -> bool:
         if self.start_time is not None and moment < self.start_time:
@@ -20,19 +49,21 @@ class TimeInterval:
         return True
 
     def overlaps(self, other: "TimeInterval") -> bool:
-        start_a = self.start_time or datetime.min
-        end_a = self.end_time or datetime.max
-        start_b = other.start_time or datetime.min
-        end_b = other.end_time or datetime.max
-        return start_a < end_b and start_b < end_a
+        return (
+            (self.start_time is None or other.end_time is None or self.start_time < other.end_time) and
+            (other.start_time is None or self.end_time is None or other.start_time < self.end_time)
+        )
 
     def modify(self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None):
+        global _bounds_version
         if start_time is not None and end_time is not None and start_time >= end_time:
             raise ValueError("start_time must be earlier than end_time")
         if start_time is not None:
             self.start_time = start_time
         if end_time is not None:
             self.end_time = end_time
+        self._update_bounds()
+        _bounds_version += 1
 
     def to_dict(self):
         return {
@@ -42,15 +73,15 @@ class TimeInterval:
 
     @classmethod
     def from_dict(cls, data):
-        start = datetime.fromisoformat(data["start_time"]) if data.get("start_time") else None
-        end = datetime.fromisoformat(data["end_time"]) if data.get("end_time") else None
-        return cls(start, end)
+        return cls(_parse_iso(data.get("start_time")), _parse_iso(data.get("end_time")))
     
     def __repr__(self):
         return f"<TimeInterval {self.start_time} → {self.end_time}>"
 
     def __lt__(self, other: "TimeInterval"):
-        return (self.start_time or datetime.min) < (other.start_time or datetime.min)
+        if self._sort_key is None or other._sort_key is None:
+            return self._sort_key is None and other._sort_key is not None
+        return self._sort_key < other._sort_key
 
 
 class TemporalRelation(Relation):
@@ -58,6 +89,10 @@ class TemporalRelation(Relation):
     Represents a relation whose truth varies over time.
     Extends the standard Relation class with a dictionary mapping intervals to TruthValues.
     """
+    __slots__ = (
+        "_interval_truths", "default_truth",
+        "_sorted_intervals", "_interval_starts", "_open_start", "_view_version",
+    )
 
     def __init__(
         self,
@@ -67,8 +102,18 @@ class TemporalRelation(Relation):
         default_truth: TruthValue | None = None
     ):
         super().__init__(predicate, roles)
-        self.interval_truths: dict[TimeInterval, TruthValue] = {}
+        self._interval_truths: dict[TimeInterval, TruthValue] = {}
+        # Per-instance default, so callers may adjust its certainty
         self.default_truth = default_truth or TruthValue(TruthState.UNKNOWN)
+        self._sorted_intervals = None  # intervals with a start, ordered by start time, rebuilt lazily
+        self._interval_starts = None   # their start times, for bisect
+        self._open_start = None        # the interval without a start; at most one fits without overlap
+        self._view_version = None      # _bounds_version the view was built under
+
+    @property
+    def interval_truths(self):
+        """Read-only view of interval -> TruthValue; change it through the interval methods below."""
+        return MappingProxyType(self._interval_truths)
 
     # ──────────────────────────────────────────────
     # Interval Management
@@ -79,19 +124,73 @@ class TemporalRelation(Relation):
         Add a new interval with a TruthValue.
         Raises ValueError if the interval overlaps any existing interval.
         """
-        for existing in self.interval_truths:
+        # Existing intervals never overlap, so only the neighbours of the
+        # new interval's position in start order (and the open-started
+        # interval, if any) can overlap it.
+        intervals, starts, open_start = self._sorted_view()
+        start = interval.start_time
+        idx = 0 if start is None else bisect_right(starts, start)
+        neighbours = intervals[max(idx - 1, 0):idx + 1]
+        if open_start is not None:
+            neighbours.append(open_start)
+        for existing in neighbours:
             if interval.overlaps(existing):
                 raise ValueError(f"New interval {interval} overlaps existing {existing}")
-        self.interval_truths[interval] = truth_value or TruthValue()
+        self._interval_truths[interval] = truth_value or TruthValue()
+
+        # Update the view in place rather than rebuilding it on next use
+        if start is None:
+            self._open_start = interval
+        else:
+            pos = bisect_right(intervals, interval._sort_key, key=self._order_key)
+            intervals.insert(pos, interval)
+            starts.insert(pos, start)
 
     def remove_interval(self, interval: TimeInterval):
         """Remove a specific interval if it exists."""
-        if interval in self.interval_truths:
-            del self.interval_truths[interval]
+        if interval in self._interval_truths:
+            del self._interval_truths[interval]
+            self._sorted_intervals = None
 
     def clear_intervals(self):
         """Remove all intervals."""
-        self.interval_truths.clear()
+        self._interval_truths.clear()
+        self._sorted_intervals = None
+
+    # Sort by start, then end, so a zero-length interval sorts before a longer one sharing its start
+    _order_key = staticmethod(attrgetter("_sort_key"))
+
+    def _sorted_view(self) -> tuple[list[TimeInterval], list[datetime], TimeInterval | None]:
+        """
+        Intervals with a start in start order, their start times, and the
+        interval without a start (or None).
+        Rebuilt after a removal or after any TimeInterval.modify(); additions
+        are applied in place.
+        """
+        intervals = self._sorted_intervals
+        if intervals is None or self._view_version != _bounds_version:
+            intervals = self._sorted_intervals = sorted(
+                (i for i in self._interval_truths if i.start_time is not None), key=self._order_key
+            )
+            self._interval_starts = [i.start_time for i in intervals]
+            self._open_start = next((i for i in self._interval_truths if i.start_time is None), None)
+            self._view_version = _bounds_version
+        return intervals, self._interval_starts, self._open_start
+
+    def _interval_at(self, moment: datetime) -> TimeInterval | None:
+        """
+        Return the interval containing moment, or None.
+
+        Intervals never overlap, so only the last one starting at or before
+        moment can contain it; that one is found by bisecting start times.
+        Before every start, only the open-started interval can.
+        """
+        intervals, starts, open_start = self._sorted_view()
+        idx = bisect_right(starts, moment) - 1
+        candidate = intervals[idx] if idx >= 0 else open_start
+        if candidate is not None and candidate.contains(moment):
+            return candidate
+        return None
 
     # ──────────────────────────────────────────────
     # Temporal Logic
@@ -100,18 +199,37 @@ class TemporalRelation(Relation):
     def truth_value_at(self, moment: datetime | None = None) -> TruthState:
         if moment is None:
             moment = datetime.now()
-        interval = next((i for i in self.interval_truths if i.contains(moment)), None)
+        interval = self._interval_at(moment)
         if interval is None:
             return self.default_truth.value
-        return self.interval_truths[interval].value
-
-    def get_current_interval(self) -> tuple[TimeInterval, TruthValue] | None:
-        """Return the current interval and its TruthValue, if any."""
-        now = datetime.now()
-        for interval, tv in self.interval_truths.items():
-            if interval.contains(now):
-                return (interval, tv)
-        return None
+        return self._interval_truths[interval].value
+
+    def truth_values_at(self, moments) -> list[TruthState]:
+        """truth_value_at for many moments, sharing one sorted-interval lookup."""
+        intervals, starts, open_start = self._sorted_view()
+        truths = self._interval_truths
+        default = self.default_truth.value
+        states = []
+        for moment in moments:
+            idx = bisect_right(starts, moment) - 1
+            candidate = intervals[idx] if idx >= 0 else open_start
+            if candidate is not None and candidate.contains(moment):
+                states.append(truths[candidate].value)
+            else:
+                states.append(default)
+        return states
+
+    def get_current_interval(self, now: datetime | None = None) -> tuple[TimeInterval, TruthValue] | None:
+        """
+        Return the current interval and its TruthValue, if any.
+        Pass now to evaluate many relations against a single clock reading.
+        """
+        if now is None:
+            now = datetime.now()
+        interval = self._interval_at(now)
+        if interval is None:
+            return None
+        return (interval, self._interval_truths[interval])
 
     def to_dict(self):
         base = super().to_dict()
@@ -123,7 +241,7 @@ class TemporalRelation(Relation):
                     "end_time": i.end_time.isoformat() if i.end_time else None,
                     "truth_value": tv.to_dict() if tv else None
                 }
-                for i, tv in self.interval_truths.items()
+                for i, tv in self._interval_truths.items()
             ]
         })
         return base
@@ -132,17 +250,16 @@ class TemporalRelation(Relation):
     def from_dict(cls, data, ontology):
         # Reconstruct the base Relation
         predicate = ontology.predicates[data["predicate"]]
-        roles = {role_name: ontology.entities[ent_id] for role_name, ent_id in data["roles"].items()}
+        entities = ontology.entities
+        roles = {role_name: entities[ent_id] for role_name, ent_id in data["roles"].items()}
         default_truth = TruthValue.from_dict(data["default_truth"]) if data.get("default_truth") else None
         r = cls(predicate, roles, default_truth=default_truth)
 
         # Reconstruct interval_truths
         for interval_dict in data.get("interval_truths", []):
-            start = datetime.fromisoformat(interval_dict["start_time"]) if interval_dict.get("start_time") else None
-            end = datetime.fromisoformat(interval_dict["end_time"]) if interval_dict.get("end_time") else None
-            interval = TimeInterval(start, end)
+            interval = TimeInterval(_parse_iso(interval_dict.get("start_time")), _parse_iso(interval_dict.get("end_time")))
             tv = TruthValue.from_dict(interval_dict["truth_value"]) if interval_dict.get("truth_value") else TruthValue()
-            r.interval_truths[interval] = tv
+            r._interval_truths[interval] = tv
 
         return r
 
@@ -151,5 +268,4 @@ class TemporalRelation(Relation):
     # ──────────────────────────────────────────────
 
     def __repr__(self):
-        role_values_str = ", ".join([f"{rv}" for rv in self.roles.values()])
-        return f"TemporalRelation({self.predicate}({role_values_str}))"
+        return f"TemporalRelation({self.predicate_name}({self._role_values_str()}))"
@@ -12,6 +12,7 @@ class TruthValue:
     Represents a truth.
     Supports TRUE, FALSE, UNKNOWN with optional certainty metadata.
     """
+    __slots__ = ("value", "certainty")
 
     def __init__(
         self,
@@ -21,8 +22,12 @@ class TruthValue:
         self.value = value
         self.certainty = certainty
 
+    def evaluate(self) -> TruthState:
+        """Return the truth state (no sampling; certainty is metadata only)."""
+        return self.value
+
     def to_dict(self):
-        return {"value": self.value.value, "certainty": getattr(self, "certainty", None)}
+        return {"value": self.value.value, "certainty": self.certainty}
 
     @classmethod
     def from_dict(cls, data):
@@ -31,3 +36,37 @@ class TruthValue:
     def __repr__(self):
         prob_str = f", certainty={self.certainty}" if self.certainty is not None else ""
         return f"{self.value.name}{prob_str}"
+
+class _SharedTruthValue(TruthValue):
+    """A TruthValue that refuses changes, so it can be shared safely."""
+    __slots__ = ()
+
+    def __init__(self, value: TruthState):
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "certainty", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Shared {self.value.name} TruthValue is read-only; construct a new TruthValue instead.")
+
+    def __delattr__(self, name):
+        self.__setattr__(name, None)
+
+    # Copies and unpickled values resolve to the same shared instance
+    def __reduce__(self):
+        return (_shared_truth_value, (self.value.name,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+def _shared_truth_value(state_name: str) -> TruthValue:
+    """Unpickling hook for the shared instances."""
+    return getattr(TruthValue, state_name)
+
+# Shared read-only instances for results that carry no certainty metadata.
+# Construct a fresh TruthValue when certainty is needed.
+TruthValue.TRUE = _SharedTruthValue(TruthState.TRUE)
+TruthValue.FALSE = _SharedTruthValue(TruthState.FALSE)
+TruthValue.UNKNOWN = _SharedTruthValue(TruthState.UNKNOWN)
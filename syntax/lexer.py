@@ -1,6 +1,7 @@
 # logos/syntax/lexer.py
 
 import re
+import sys
 from collections import namedtuple
 
 # Token definition
@@ -67,43 +68,115 @@ TOK_REGEX = "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPECIFI
 TOK_REGEX_COMPILED = re.compile(TOK_REGEX, re.IGNORECASE)
 
 
+# Upper-cased keyword -> shared token type string, so keyword tokens carry
+# one canonical (interned) type object instead of a fresh upper() result
+_KEYWORD_KINDS = {sys.intern(k): sys.intern(k) for k in KEYWORDS}
+
+# Per-kind patterns for the spans that are still scanned by regex
+_PATTERNS = {name: re.compile(pattern, re.IGNORECASE) for name, pattern in TOKEN_SPECIFICATION}
+_STRING_MATCH = _PATTERNS["STRING"].match
+_NUMBER_MATCH = _PATTERNS["NUMBER"].match
+_IDENTIFIER_MATCH = _PATTERNS["IDENTIFIER"].match
+_SKIP_MATCH = _PATTERNS["SKIP"].match
+
+_DELIMITERS = {
+    "(": "LPAREN", ")": "RPAREN", "{": "LBRACE", "}": "RBRACE",
+    "[": "LBRACKET", "]": "RBRACKET", ",": "COMMA", ":": "COLON", ";": "SEMICOLON",
+}
+# Operators that may be followed by a second character: "==", ">=", "<=", "**"
+_OPERATOR_SECOND = {"=": "=", ">": "=", "<": "=", "*": "*"}
+
+# First-character dispatch for ASCII input. Characters not listed here
+# (non-ASCII, or ASCII that no pattern accepts) go through TOK_REGEX_COMPILED,
+# so the token rules above stay the single source of truth.
+_DISPATCH = {" ": "SKIP", "\t": "SKIP", "\n": "NEWLINE", "#": "SCOMMENT", "/": "SLASH", '"': "STRING", "'": "STRING"}
+_DISPATCH.update(dict.fromkeys("0123456789", "NUMBER"))
+_DISPATCH.update(dict.fromkeys("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_", "IDENTIFIER"))
+_DISPATCH.update(dict.fromkeys(_DELIMITERS, "DELIMITER"))
+_DISPATCH.update(dict.fromkeys("+-%*=<>", "OPERATOR"))
+
+
 def tokenize(code):
     """
     Token generator for Logos source code.
     Yields Token(type, value, line, column)
+
+    Walks the source by index, dispatching on the first character of each
+    token; produces exactly the tokens TOK_REGEX_COMPILED would.
     """
     line_num = 1
     line_start = 0
-
-    # mo: match object
-    for mo in TOK_REGEX_COMPILED.finditer(code):
-        kind = mo.lastgroup
-        value = mo.group()
-        column = mo.start() - line_start + 1
-
-        if kind == "NEWLINE":
-            line_start = mo.end()
-            line_num += 1
-            continue
+    pos = 0
+    n = len(code)
+    dispatch = _DISPATCH.get
+
+    while pos < n:
+        start = pos
+        ch = code[pos]
+        kind = dispatch(ch)
+
+        if kind == "IDENTIFIER":
+            pos = _IDENTIFIER_MATCH(code, pos).end()
+            value = code[start:pos]
+            kind = _KEYWORD_KINDS.get(value.upper(), kind)
         elif kind == "SKIP":
+            pos = _SKIP_MATCH(code, pos).end()
             continue
-        elif kind in ("SCOMMENT", "MCOMMENT"):
+        elif kind == "NEWLINE":
+            pos += 1
+            line_start = pos
+            line_num += 1
             continue
-        elif kind == "IDENTIFIER":
-            if value.upper() in KEYWORDS:
-                kind = value.upper()
+        elif kind == "DELIMITER":
+            pos += 1
+            kind = _DELIMITERS[ch]
+            value = ch
         elif kind == "NUMBER":
+            pos = _NUMBER_MATCH(code, pos).end()
+            value = code[start:pos]
             if "." in value:
                 value = float(value)
             else:
                 value = int(value)
-        elif kind == "STRING":
-            value = value[1:-1]  # Remove quotes
-
-        elif kind == "MISMATCH":
-            raise SyntaxError(f"Unexpected character {value!r} at line {line_num} column {column}")
-
-        yield Token(kind, value, line_num, column)
+        elif kind == "OPERATOR":
+            pos += 2 if code[pos + 1:pos + 2] == _OPERATOR_SECOND.get(ch) else 1
+            value = code[start:pos]
+        elif kind == "SLASH":
+            # "/*" opens a comment only if it is closed; otherwise "/" is an operator
+            end = code.find("*/", pos + 2) if code.startswith("/*", pos) else -1
+            if end != -1:
+                pos = end + 2
+                continue
+            pos += 1
+            kind = "OPERATOR"
+            value = ch
+        elif kind == "SCOMMENT":
+            end = code.find("\n", pos)
+            pos = n if end == -1 else end
+            continue
+        else:
+            if kind == "STRING":
+                mo = _STRING_MATCH(code, pos)  # None for an unterminated string
+            else:
+                mo = TOK_REGEX_COMPILED.match(code, pos)
+                kind = mo.lastgroup
+            if mo is None or kind == "MISMATCH":
+                raise SyntaxError(f"Unexpected character {ch!r} at line {line_num} column {start - line_start + 1}")
+            pos = mo.end()
+            value = mo.group()
+            if kind in ("SKIP", "SCOMMENT", "MCOMMENT"):
+                continue
+            elif kind == "IDENTIFIER":
+                kind = _KEYWORD_KINDS.get(value.upper(), kind)
+            elif kind == "NUMBER":
+                if "." in value:
+                    value = float(value)
+                else:
+                    value = int(value)
+            elif kind == "STRING":
+                value = value[1:-1]  # Remove quotes
+
+        yield Token(kind, value, line_num, start - line_start + 1)
 
 
 # Simple test
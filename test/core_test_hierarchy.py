@@ -26,3 +26,78 @@ onto.describe_hierarchy(DOG, show_description=True)
 
 print("\nHierarchy for FIDO:")
 onto.describe_hierarchy(FIDO, show_description=True)
+
+# Batch construction resolves parents by name within the batch and the ontology
+CAT, KITTEN = onto.add_entities([
+    {"name": "CAT", "word_type": "NOUN", "parents": ["mammal", SPECIES], "description": "Felis catus"},
+    {"name": "KITTEN", "word_type": "NOUN", "parents": ["CAT"]},
+])
+assert KITTEN.parents == (CAT,) and CAT.parents == (MAMMAL, SPECIES)
+assert ANIMAL in KITTEN.get_all_ancestors()
+assert onto.query_entities(ancestor="CAT") is KITTEN
+try:
+    onto.add_entities([{"name": "OWL", "word_type": "NOUN"}, {"name": "owl", "word_type": "NOUN"}])
+except ValueError as e:
+    print(f"Caught expected error: {e}")
+else:
+    raise AssertionError("duplicate names in a batch should be rejected")
+assert onto.query_entities(name="OWL") is None
+
+print("\nHierarchy for KITTEN:")
+onto.describe_hierarchy(KITTEN)
+
+# Re-parenting after registration is picked up by parent and ancestor queries
+BIRD = onto.add_entity("BIRD", word_type="NOUN")
+ROBIN = onto.add_entity("ROBIN", word_type="NOUN", parents=[BIRD])
+assert onto.query_entities(ancestor="ANIMAL") == [MAMMAL, DOG, A_DOG, FIDO, CAT, KITTEN]
+BIRD.parents = [ANIMAL]
+assert onto.query_entities(parent="ANIMAL") == [MAMMAL, BIRD]
+assert onto.query_entities(ancestor="ANIMAL") == [MAMMAL, DOG, A_DOG, FIDO, CAT, KITTEN, BIRD, ROBIN]
+ROBIN.parents = [ANIMAL]
+assert onto.query_entities(parent="BIRD") is None
+assert onto.query_entities(parent="ANIMAL") == [MAMMAL, BIRD, ROBIN]
+
+# Name and alias changes after registration reach name queries
+onto.add_alias("pooch", DOG)
+assert DOG.aliases == ("POOCH",) and onto.query_entities(name="pooch") is DOG
+ROBIN.aliases = (*ROBIN.aliases, "redbreast")
+assert onto.query_entities(name="REDBREAST") is ROBIN
+BIRD.name = "avian"
+assert onto.query_entities(name="BIRD") is None and onto.query_entities(name="AVIAN") is BIRD
+try:
+    DOG.aliases.append("HOUND")
+except AttributeError:
+    pass
+else:
+    raise AssertionError("aliases should not be mutable in place")
+
+# Parents can only be replaced, so cached ancestors never go stale
+try:
+    ROBIN.parents.append(BIRD)
+except AttributeError:
+    pass
+else:
+    raise AssertionError("parents should not be mutable in place")
+ROBIN.parents = (*ROBIN.parents, BIRD)
+assert ROBIN.parent_names() == "ANIMAL, AVIAN" and BIRD in ROBIN.get_all_ancestors()
+
+# Hierarchy filters also see unregistered ancestors and directly stored entities
+from core.entity import Entity
+loose = Ontology()
+PLANT = Entity("PLANT", word_type="NOUN")  # never registered
+TREE = loose.add_entity("TREE", word_type="NOUN", parents=[PLANT])
+OAK = loose.add_entity("OAK", word_type="NOUN", parents=[TREE])
+assert loose.query_entities(ancestor="PLANT") == [TREE, OAK]
+assert loose.query_entities(ancestor="TREE") is OAK
+assert loose.query_entities(parent="PLANT") is TREE
+assert loose.query_entities(parent="TREE") is OAK
+ELM = Entity("ELM", word_type="NOUN", parents=[TREE])
+loose.entities[ELM.id] = ELM
+assert loose.query_entities(name="ELM") is ELM
+assert loose.query_entities(ancestor="TREE") == [OAK, ELM]
+assert loose.query_entities(parent="TREE") == [OAK, ELM]
+
+# Renaming a parent shows up in its children's hierarchy lines
+assert OAK.parent_names() == "TREE"
+TREE.name = "arbor"
+assert OAK.parent_names() == "ARBOR"
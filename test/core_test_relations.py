@@ -3,6 +3,7 @@ import os
 from datetime import timedelta
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.ontology import Ontology
+from core.entity import Entity
 from core.truth import TruthState, TruthValue
 
 onto = Ontology()
@@ -40,3 +41,75 @@ r_unknown = onto.add_relation(
 # Print all relations
 for r in onto.relations:
     print(r)
+
+# --- Relations per entity ---
+assert A.all_relations() == [r_true, r_unknown]
+assert C.all_relations() == [r_false, r_unknown]
+
+# --- query_relations ---
+assert onto.query_relations(predicate="REL") == [r_true, r_false, r_unknown]
+assert onto.query_relations(entities=["A"]) == [r_true, r_unknown]
+assert onto.query_relations(predicate="REL", entities=["C"]) == [r_false, r_unknown]
+assert onto.query_relations(entities=["A", "C"]) == [r_unknown]
+assert onto.query_relations(roles=["subject"], truth_value=TruthValue(TruthState.FALSE)) is None  # compared by identity
+assert onto.query_relations(predicate="OTHER") is None
+assert onto.query_relations(entities=["NOBODY"]) is None
+
+# Homonyms and aliases: every entity answering to the name counts
+onto.add_alias("letter", B)
+onto.add_alias("letter", A)
+assert onto.query_entities(name="LETTER") == [A, B]  # registration order, not alias order
+assert onto.query_relations(entities=["LETTER"]) == [r_true, r_false, r_unknown]
+C.aliases = ("SEA",)
+assert onto.query_relations(entities=["SEA"]) == [r_false, r_unknown]
+
+# Participants that were never registered with the ontology are still found
+X = Entity("X", word_type="NOUN")
+r_loose = onto.add_relation(REL, roles={"subject": X, "object": A})
+assert onto.query_relations(entities=["X"]) == [r_loose]
+assert onto.query_relations(predicate="REL", entities=["A"]) == [r_true, r_unknown, r_loose]
+
+# --- Inverse predicates ---
+OWNS = onto.add_predicate("OWNS")
+a_owns_b = onto.add_relation(
+    OWNS,
+    roles={"owner": A, "owned": B},
+    truth_value=TruthValue(value=TruthState.TRUE, certainty=0.9)
+)
+OWNED_BY = onto.add_inverse_predicate(OWNS, "owned_by", {"owner": "object", "owned": "subject"})
+assert OWNED_BY.inverse_of is OWNS and OWNS.inverses == [OWNED_BY]
+
+# Existing relations get an inverse with the roles mapped and the truth value copied
+[b_owned_by_a] = onto.query_relations(predicate="OWNED_BY")
+print(b_owned_by_a)
+assert b_owned_by_a.roles == {"object": A, "subject": B}
+assert b_owned_by_a.truth_value.value == TruthState.TRUE and b_owned_by_a.truth_value.certainty == 0.9
+assert b_owned_by_a.truth_value is not a_owns_b.truth_value
+
+# --- Implications ---
+from core.implies import ImpliesRelation
+
+c_rel_a = onto.add_relation(REL, roles={"subject": C, "object": A})  # consequent, truth not yet known
+implication = ImpliesRelation(r_true, c_rel_a, truth_value=TruthValue(TruthState.TRUE))
+print(implication)
+assert implication.infer_consequent_truth().value == TruthState.TRUE  # TRUE antecedent, TRUE implication
+assert ImpliesRelation(r_false, c_rel_a, truth_value=TruthValue(TruthState.TRUE)).infer_consequent_truth().value == TruthState.UNKNOWN
+assert ImpliesRelation(r_true, c_rel_a).infer_consequent_truth().value == TruthState.UNKNOWN  # implication itself unknown
+assert ImpliesRelation(r_true, r_false, truth_value=TruthValue(TruthState.TRUE)).infer_consequent_truth() is r_false.truth_value
+
+# --- Relations appended to onto.relations directly ---
+from core.relation import Relation
+
+direct = Ontology()
+D = direct.add_entity("D", word_type="NOUN")
+E = direct.add_entity("E", word_type="NOUN")
+LIKES = direct.add_predicate("LIKES")
+d_likes_e = Relation(LIKES, roles={"subject": D, "object": E})
+direct.relations.append(d_likes_e)
+assert direct.query_relations(predicate="LIKES") == [d_likes_e]
+assert direct.query_relations(predicate="LIKES", entities=["D"]) == [d_likes_e]
+assert direct.add_relation(LIKES, roles={"subject": D, "object": E}) is d_likes_e  # not duplicated
+e_likes_d = direct.add_relation(LIKES, roles={"subject": E, "object": D})
+assert direct.query_relations(entities=["D"]) == [d_likes_e, e_likes_d]
+direct.relations.remove(d_likes_e)
+assert direct.query_relations(predicate="LIKES") == [e_likes_d]
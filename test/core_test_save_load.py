@@ -66,6 +66,10 @@ def test_save_load():
 
     ontology.relations.append(tr)
 
+    # Non-finite certainties are written as NaN and must still load
+    LIKES = ontology.add_predicate("LIKES")
+    ontology.add_relation(LIKES, roles={"subject": DEX, "object": FOOD}, truth_value=TruthValue(TruthState.TRUE, certainty=float("nan")))
+
     # --- Save ontology ---
     save_ontology(ontology, "ontology_test.json")
 
@@ -76,9 +80,27 @@ def test_save_load():
     assert "DEX" in [e.name for e in new_ontology.entities.values()]
     assert "FOOD" in [e.name for e in new_ontology.entities.values()]
     assert any(r.predicate.name == "EATS" for r in new_ontology.relations)
+    assert any(r.predicate.name == "LIKES" for r in new_ontology.relations)
     assert any(qr.quantifier == Quantifier.FORALL for qr in new_ontology.quantified_relations)
     assert any(qr.quantifier == Quantifier.EXISTS for qr in new_ontology.quantified_relations)
 
+    # --- Instantiating templates ---
+    dex_eats_food = DEX_EATS_EVERYTHING.instantiate(X=FOOD)
+    assert dex_eats_food.predicate is EATS  # bound to the registered predicate
+    assert dex_eats_food.roles == {"subject": "DEX", "object": FOOD}
+    try:
+        DEX_EATS_SOMETHING.instantiate(X=FOOD)
+    except ValueError as e:
+        print(f"Caught expected error: {e}")
+    else:
+        raise AssertionError("instantiate should require the template's variables")
+
+    loaded_forall = next(qr for qr in new_ontology.quantified_relations if qr.quantifier == Quantifier.FORALL)
+    new_food = next(e for e in new_ontology.entities.values() if e.name == "FOOD")
+    loaded_eats_food = loaded_forall.instantiate(X=new_food)
+    assert loaded_eats_food.predicate is new_ontology.predicates["EATS"]
+    assert loaded_eats_food.roles == {"subject": "DEX", "object": new_food}
+
     print("Save/load test passed!")
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 # core_test_temporal.py
 import sys
 import os
-from datetime import datetime, timedelta
+import copy
+import pickle
+from datetime import datetime, timedelta, timezone
 
 # --- Setup import path ---
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -52,6 +54,11 @@ THOMAS_ATTENDS_A_MEETING.add_interval(TimeInterval(future_start, future_end), Tr
 assert THOMAS_ATTENDS_A_MEETING.truth_value_at(future_start - timedelta(minutes=1)) == TruthState.UNKNOWN  # default_truth
 assert THOMAS_ATTENDS_A_MEETING.truth_value_at(future_start + timedelta(minutes=30)) == TruthState.TRUE
 
+# --- Batch lookup matches single-moment lookups ---
+moments = [past_start + timedelta(minutes=30), start_time - timedelta(minutes=5), start_time, future_start + timedelta(minutes=30)]
+assert THOMAS_ATTENDS_A_MEETING.truth_values_at(moments) == [THOMAS_ATTENDS_A_MEETING.truth_value_at(m) for m in moments]
+assert THOMAS_ATTENDS_A_MEETING.truth_values_at(moments) == [TruthState.TRUE, TruthState.UNKNOWN, TruthState.TRUE, TruthState.TRUE]
+
 # --- Verify all intervals are stored correctly ---
 print("\nAll intervals in THOMAS_ATTENDS_A_MEETING:")
 for interval, tv in THOMAS_ATTENDS_A_MEETING.interval_truths.items():
@@ -78,4 +85,64 @@ tr_false_default = TemporalRelation(
 print("\nDefault FALSE test:")
 assert tr_false_default.truth_value_at(datetime.now() - timedelta(days=100)) == TruthState.FALSE
 
+# --- Lookups follow interval changes ---
+tr_changes = TemporalRelation(predicate=ATTENDS, roles={"subject": THOMAS, "object": A_MEETING})
+early = TimeInterval(start_time, start_time + timedelta(minutes=10))
+late = TimeInterval(start_time + timedelta(hours=1), start_time + timedelta(hours=2))
+tr_changes.add_interval(early, TruthValue(TruthState.TRUE))
+tr_changes.add_interval(late, TruthValue(TruthState.FALSE))
+assert tr_changes.truth_value_at(start_time + timedelta(minutes=30)) == TruthState.UNKNOWN
+
+# Moving an attached interval's bounds is seen by the next lookup
+late.modify(start_time=start_time + timedelta(minutes=20))
+assert tr_changes.truth_value_at(start_time + timedelta(minutes=30)) == TruthState.FALSE
+
+# Swapping one interval for another keeps the count but not the answer
+tr_changes.remove_interval(early)
+tr_changes.add_interval(TimeInterval(start_time - timedelta(minutes=10), start_time), TruthValue(TruthState.TRUE))
+assert tr_changes.truth_value_at(start_time + timedelta(minutes=5)) == TruthState.UNKNOWN
+assert tr_changes.truth_value_at(start_time - timedelta(minutes=5)) == TruthState.TRUE
+
+# Open bounds work with timezone-aware datetimes
+aware_now = datetime.now(timezone.utc)
+tr_aware = TemporalRelation(predicate=ATTENDS, roles={"subject": THOMAS, "object": A_MEETING})
+tr_aware.add_interval(TimeInterval(None, aware_now + timedelta(hours=1)), TruthValue(TruthState.TRUE))
+tr_aware.add_interval(TimeInterval(aware_now + timedelta(hours=2)), TruthValue(TruthState.FALSE))
+assert tr_aware.truth_values_at([aware_now, aware_now + timedelta(hours=1), aware_now + timedelta(days=1)]) == [
+    TruthState.TRUE, TruthState.UNKNOWN, TruthState.FALSE
+]
+try:
+    tr_aware.add_interval(TimeInterval(None, aware_now - timedelta(days=1)))
+except ValueError as e:
+    print(f"Caught expected error: {e}")
+else:
+    raise AssertionError("a second open-started interval always overlaps the first")
+
+# interval_truths is a read-only view; changes go through the interval methods
+try:
+    tr_changes.interval_truths[early] = TruthValue(TruthState.TRUE)
+except TypeError:
+    print("Caught expected error: interval_truths is read-only")
+else:
+    raise AssertionError("interval_truths should be read-only")
+
+# Each relation owns its default, so adjusting one leaves the others alone
+THOMAS_ATTENDS_A_MEETING.default_truth.certainty = 0.5
+assert tr_changes.default_truth.certainty is None and TruthValue.UNKNOWN.certainty is None
+try:
+    TruthValue.UNKNOWN.certainty = 0.5
+except AttributeError as e:
+    print(f"Caught expected error: {e}")
+else:
+    raise AssertionError("the shared TruthValue instances should be read-only")
+
+# Copies and pickles round-trip, keeping the shared instances shared
+restored = pickle.loads(pickle.dumps(onto))
+assert copy.deepcopy(TruthValue.UNKNOWN) is TruthValue.UNKNOWN
+assert pickle.loads(pickle.dumps(TruthValue.TRUE)) is TruthValue.TRUE
+tr_copy = copy.deepcopy(tr_changes)
+assert tr_copy.truth_values_at(moments) == tr_changes.truth_values_at(moments)
+restored_tr = next(r for r in restored.relations if isinstance(r, TemporalRelation))
+assert restored_tr.truth_values_at(moments) == THOMAS_ATTENDS_A_MEETING.truth_values_at(moments)
+
 print("\n✅ All TemporalRelation interval tests passed!\n")
@@ -0,0 +1,52 @@
+# syntax_test_lexer.py
+import sys
+import os
+
+# --- Setup import path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from syntax.lexer import tokenize, Token
+
+print("\n=== Lexer Tests ===")
+
+code = '''# comment
+x = 42 /* inline */ y >= 3.5
+IF isDog(FIDO) AND 'a\\'b' ** 2
+'''
+tokens = list(tokenize(code))
+for tok in tokens:
+    print(f"  {tok}")
+
+assert tokens == [
+    Token("IDENTIFIER", "x", 2, 1),
+    Token("OPERATOR", "=", 2, 3),
+    Token("NUMBER", 42, 2, 5),
+    Token("IDENTIFIER", "y", 2, 21),
+    Token("OPERATOR", ">=", 2, 23),
+    Token("NUMBER", 3.5, 2, 26),
+    Token("IF", "IF", 3, 1),
+    Token("IDENTIFIER", "isDog", 3, 4),
+    Token("LPAREN", "(", 3, 9),
+    Token("IDENTIFIER", "FIDO", 3, 10),
+    Token("RPAREN", ")", 3, 14),
+    Token("AND", "AND", 3, 16),
+    Token("STRING", "a\\'b", 3, 20),
+    Token("OPERATOR", "**", 3, 27),
+    Token("NUMBER", 2, 3, 30),
+]
+
+# Keywords are case-insensitive
+assert [t.type for t in tokenize("forall Exists not")] == ["FORALL", "EXISTS", "NOT"]
+
+# An unclosed comment opener is just two operators
+assert [t.value for t in tokenize("/* x")] == ["/", "*", "x"]
+
+# --- Unexpected characters ---
+for bad in ("x = @", "'unterminated", "a\r\nb"):
+    try:
+        list(tokenize(bad))
+    except SyntaxError as e:
+        print(f"Caught expected error: {e}")
+    else:
+        raise AssertionError(f"{bad!r} should not tokenize")
+
+print("\n✅ All lexer tests passed!\n")